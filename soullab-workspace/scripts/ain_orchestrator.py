@@ -11,13 +11,23 @@ Based on Soullab consciousness computing architecture.
 """
 
 import asyncio
+import difflib
+import functools
 import json
 import os
 import sys
+import threading
+import time
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
+
+# Optional fast JSON (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import provider abstraction
 try:
@@ -32,10 +42,98 @@ WORKSPACE = Path.home() / "soullab-workspace"
 LOG_DIR = WORKSPACE / ".logs"
 AIN_LOG = LOG_DIR / "ain_sessions.jsonl"
 CONTEXT_DIR = WORKSPACE / "llm-context"
+STYLE_GUIDE = CONTEXT_DIR / "writing-style.md"
 
 # Get preferred provider from environment (or auto-detect)
 PROVIDER_PREFERENCE = os.environ.get("AIN_PROVIDER", "auto")
 
+# Only the head of a reviewed file (and of the style guide) is sent to the committee
+REVIEW_MAX_CHARS = 3000
+STYLE_GUIDE_MAX_CHARS = 500
+
+# Opt-in semantic cache over past deliberation questions
+SEMANTIC_CACHE_ENABLED = os.environ.get("AIN_SEMANTIC_CACHE") == "1"
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("AIN_SEMANTIC_THRESHOLD", "0.92"))
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_INDEX = LOG_DIR / "ain_semantic_index.jsonl"  # Question embeddings for the session log
+
+# Opt-in review cache: update a prior review via the local model when content is similar
+REVIEW_CACHE_ENABLED = os.environ.get("AIN_REVIEW_CACHE") == "1"
+REVIEW_CACHE_THRESHOLD = float(os.environ.get("AIN_REVIEW_CACHE_THRESHOLD", "0.85"))
+REVIEW_CACHE = LOG_DIR / "ain_review_cache.jsonl"
+REVIEW_CACHE_MAX_PER_FRAMING = 20  # Newest reviews kept per lens (older ones are compacted away)
+
+# Model per provider: agent lenses run on cheap/fast models, synthesis on the top tier
+# (providers not listed, e.g. local Ollama, use their own model)
+AGENT_MODELS = {
+    "anthropic": os.environ.get("AIN_AGENT_MODEL", "claude-haiku-4-5-20251001"),
+    "openai": os.environ.get("AIN_AGENT_OPENAI_MODEL", "gpt-4o-mini"),
+}
+SYNTH_MODELS = {
+    "anthropic": os.environ.get("AIN_SYNTH_MODEL", "claude-sonnet-4-5-20250929"),
+    "openai": os.environ.get("AIN_SYNTH_OPENAI_MODEL", "gpt-4-turbo-preview"),
+}
+
+# Max agents talking to providers at once; 0 (default) = no cap, the whole
+# committee runs in parallel. Per-provider rate limits: AIN_<NAME>_MAX_CONC
+MAX_PARALLEL = int(os.environ.get("AIN_MAX_PARALLEL") or 0)
+
+# Static agent system prompt pieces (only framing/context vary per agent)
+_AGENT_PREFIX = """You are participating in a multi-perspective committee deliberation.
+
+Your specific lens/framing: """
+
+_AGENT_SUFFIX = """
+
+Respond to the question ONLY from this perspective. Be concise but insightful.
+Your response should be 2-4 paragraphs maximum.
+
+Do not try to synthesize other perspectives - that's the orchestrator's job.
+Focus deeply on your assigned lens.
+"""
+
+_AGENT_CONTEXT = "\n\nRelevant context:\n"
+
+# Static synthesis prompt scaffold (only question/responses vary per call)
+_SYNTH_PREFIX = """You are synthesizing a multi-perspective committee deliberation.
+
+ORIGINAL QUESTION:
+"""
+
+_SYNTH_MID = "\n\nAGENT RESPONSES:\n"
+
+_SYNTH_SUFFIX = """
+
+Your task: Generate a dialectical synthesis that:
+
+1. **Identifies Key Tensions**: Where do perspectives conflict or diverge?
+2. **Maps Polarities**: What are the thesis/antithesis pairs?
+3. **Synthesizes Higher-Order Insights**: What emerges from holding tensions together?
+4. **Detects Novelty**: Is this just recombination or genuine emergence?
+5. **Provides Recommendation**: What's the integrated path forward?
+
+Format your synthesis as:
+
+### Synthesis
+
+[2-3 paragraphs integrating the perspectives]
+
+### Key Tensions
+
+- **[Tension 1]**: [Description]
+- **[Tension 2]**: [Description]
+
+### Emergence Detected
+
+[Rating: ⭐ Recombination | ⭐⭐ Synthesis | ⭐⭐⭐ Breakthrough]
+
+[Explanation of why this rating]
+
+### Recommended Action
+
+[Clear next step that honors the dialectic]
+"""
+
 # Initialize router (will check for available providers)
 router = AINProviderRouter(preference=PROVIDER_PREFERENCE)
 
@@ -46,12 +144,27 @@ def _log(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
 
+def _envelope_bytes(data: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Serialize a result envelope as UTF-8 JSON (indented when pretty)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if pretty else None).encode()
+
+
+def format_envelope(data: Dict[str, Any], pretty: bool = False) -> str:
+    """Serialize a result envelope as JSON text (indented when pretty)"""
+    return _envelope_bytes(data, pretty).decode()
+
+
 def _emit_json(obj: Dict[str, Any], pretty: bool = False):
     """Emit JSON to stdout (for machine-readable output)"""
-    if pretty:
-        print(json.dumps(obj, ensure_ascii=False, indent=2))
-    else:
-        print(json.dumps(obj, ensure_ascii=False))
+    buffer = getattr(sys.stdout, "buffer", None)  # None for text-only streams (e.g. StringIO)
+    if buffer is None:
+        print(format_envelope(obj, pretty))
+        return
+    sys.stdout.flush()  # Keep ordering with anything already print()ed
+    buffer.write(_envelope_bytes(obj, pretty) + b"\n")
+    buffer.flush()
 
 
 def _result_envelope_ok(result: Dict[str, Any]) -> Dict[str, Any]:
@@ -59,15 +172,220 @@ def _result_envelope_ok(result: Dict[str, Any]) -> Dict[str, Any]:
     return {"ok": True, **result}
 
 
-def _result_envelope_err(stage: str, err: Exception) -> Dict[str, Any]:
-    """Wrap error in standard envelope"""
-    return {
+def _result_envelope_err(stage: str, err: Exception, want_traceback: bool = True) -> Dict[str, Any]:
+    """Wrap error in standard envelope (traceback only formatted when wanted)"""
+    envelope = {
         "ok": False,
         "stage": stage,
         "error": str(err),
         "error_type": err.__class__.__name__,
-        "traceback": traceback.format_exc(limit=8),
     }
+    if want_traceback:
+        envelope["traceback"] = traceback.format_exc(limit=8)
+    return envelope
+
+
+def _render_response_section(name: str, framing: str, response: str) -> str:
+    """One agent's section of the synthesis prompt"""
+    return f"\n## {name} ({framing})\n\n{response}\n"
+
+
+class LocalEmbedder:
+    """Lazily loaded fastembed model (ONNX on CPU) for the local caches"""
+
+    def __init__(self, model_name: str = SEMANTIC_CACHE_MODEL):
+        self.model_name = model_name
+        self._model = None
+
+    def embed(self, texts: List[str]):
+        """Unit-normalized embeddings as rows of a numpy matrix"""
+        if self._model is None:
+            try:
+                from fastembed import TextEmbedding
+            except ImportError:
+                raise ImportError("fastembed package not installed. Run: pip install fastembed")
+            self._model = TextEmbedding(model_name=self.model_name)
+
+        import numpy as np  # Installed with fastembed
+        matrix = np.vstack(list(self._model.embed(texts)))
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+embedder = LocalEmbedder()
+
+
+class SemanticCache:
+    """
+    Nearest-question lookup over logged sessions using local embeddings.
+
+    The index is built lazily from the session log on first lookup and
+    extended as sessions complete. Question embeddings are persisted to a
+    sidecar JSONL, so only questions not seen before are embedded on load.
+    A hit also requires the same framings (names and texts) and context, so
+    a writing review is never answered with a general deliberation and a
+    style guide or config change is never answered from stale sessions.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        index_path: Path = SEMANTIC_INDEX,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD
+    ):
+        self.log_path = log_path
+        self.index_path = index_path
+        self.threshold = threshold
+        self._sessions: Optional[List[Dict[str, Any]]] = None
+        self._keys: List[tuple] = []
+        self._vectors: Dict[str, Any] = {}
+        self._matrix = None
+
+    @staticmethod
+    def _committee_key(framings: List[Dict[str, str]], context: str) -> tuple:
+        return (tuple(sorted((f["name"], f["framing"]) for f in framings)), context)
+
+    def _load_vectors(self) -> Dict[str, List[float]]:
+        """Persisted question embeddings for the current embedding model"""
+        vectors = {}
+        try:
+            with open(self.index_path, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        if entry["model"] == embedder.model_name:
+                            vectors[entry["question"]] = entry["embedding"]
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Skip torn/corrupt lines
+        except FileNotFoundError:
+            pass
+        return vectors
+
+    def _persist(self, questions: List[str], matrix):
+        lines = [
+            json.dumps({"model": embedder.model_name, "question": q, "embedding": [float(x) for x in row]}) + "\n"
+            for q, row in zip(questions, matrix)
+        ]
+        with open(self.index_path, 'a') as f:
+            f.write("".join(lines))
+
+    def _load(self):
+        if self._sessions is not None:
+            return
+
+        self._sessions = []
+        try:
+            with open(self.log_path, 'rb') as f:
+                for line in f:
+                    try:
+                        session = json.loads(line)
+                    except ValueError:
+                        continue
+                    # Sessions logged without their context can't be matched safely
+                    if session.get("question") and session.get("synthesis") and "context" in session:
+                        self._sessions.append(session)
+        except FileNotFoundError:
+            pass
+
+        if not self._sessions:
+            return
+
+        import numpy as np
+        self._vectors = self._load_vectors()
+        missing = list(dict.fromkeys(s["question"] for s in self._sessions if s["question"] not in self._vectors))
+        if missing:
+            embedded = embedder.embed(missing)
+            self._vectors.update(zip(missing, embedded))
+            self._persist(missing, embedded)
+
+        self._keys = [self._committee_key(s.get("framings", []), s["context"]) for s in self._sessions]
+        self._matrix = np.array([self._vectors[s["question"]] for s in self._sessions], dtype=np.float32)
+
+    def lookup(
+        self,
+        question: str,
+        framings: List[Dict[str, str]],
+        context: str = ""
+    ) -> Optional[tuple[float, Dict[str, Any]]]:
+        """Return (similarity, session) for the closest prior deliberation, or None"""
+        self._load()
+        if self._matrix is None:
+            return None
+
+        scores = self._matrix @ embedder.embed([question])[0]
+        key = self._committee_key(framings, context)
+        for index in scores.argsort()[::-1]:
+            score = float(scores[index])
+            if score < self.threshold:
+                break
+            if self._keys[index] == key:
+                return (score, self._sessions[index])
+        return None
+
+    def add(self, session: Dict[str, Any]):
+        """Index a newly completed session"""
+        if self._sessions is None:
+            return  # Not loaded yet; picked up from the log on first lookup
+
+        import numpy as np
+        question = session["question"]
+        if question not in self._vectors:
+            self._vectors[question] = embedder.embed([question])[0]
+            self._persist([question], [self._vectors[question]])
+        row = np.asarray([self._vectors[question]], dtype=np.float32)
+        self._matrix = row if self._matrix is None else np.vstack([self._matrix, row])
+        self._keys.append(self._committee_key(session["framings"], session["context"]))
+        self._sessions.append(session)
+
+
+def _build_system_prompt(framing: str, context: str = "") -> str:
+    """Agent system prompt (fixed per agent, so built once at construction)"""
+    if context:
+        return "".join((_AGENT_PREFIX, framing, _AGENT_SUFFIX, _AGENT_CONTEXT, context))
+    return "".join((_AGENT_PREFIX, framing, _AGENT_SUFFIX))
+
+
+def _style_guide_mtime_ns() -> int:
+    """Style guide mtime (0 if missing), used as the _load_style_guide cache key"""
+    try:
+        return STYLE_GUIDE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=1)
+def _load_style_guide(mtime_ns: int) -> str:
+    """Head of the writing style guide (only the head is ever used in review prompts)"""
+    try:
+        with open(STYLE_GUIDE, 'r') as f:
+            return f.read(STYLE_GUIDE_MAX_CHARS)
+    except OSError:
+        return ""
+
+
+def _build_review_framings(style_guide_head: str) -> List[Dict[str, str]]:
+    """Writing review lenses"""
+    return [
+        {
+            "name": "Technical Accuracy",
+            "framing": "Review for technical accuracy, logical consistency, and factual correctness. Flag anything misleading or imprecise."
+        },
+        {
+            "name": "Voice & Style",
+            "framing": f"Review for voice consistency and style. Reference the style guide:\n\n{style_guide_head}...\n\nFlag AI-speak, corporate jargon, or places where the voice slips."
+        },
+        {
+            "name": "Audience Resonance",
+            "framing": "Review from the reader's perspective. What's confusing? What assumptions are made? What needs more context or examples?"
+        },
+        {
+            "name": "Structure & Flow",
+            "framing": "Review the structure and flow. Are transitions smooth? Is the argument building logically? Are sections in the right order?"
+        },
+        {
+            "name": "Depth & Impact",
+            "framing": "Review for intellectual depth and potential impact. What could be explored more deeply? What insights are underdeveloped? What's the archetypal/mythic dimension?"
+        }
+    ]
 
 
 class Agent:
@@ -77,31 +395,25 @@ class Agent:
         self.name = name
         self.framing = framing
         self.context = context
+        self._system_prompt = _build_system_prompt(framing, context)
 
-    async def respond(self, question: str, verbose: bool = False) -> str:
+    async def respond(
+        self,
+        question: str,
+        verbose: bool = False,
+        use_cache: Optional[bool] = None
+    ) -> str:
         """Get agent's response to question through their lens"""
 
-        system_prompt = f"""You are participating in a multi-perspective committee deliberation.
-
-Your specific lens/framing: {self.framing}
-
-Respond to the question ONLY from this perspective. Be concise but insightful.
-Your response should be 2-4 paragraphs maximum.
-
-Do not try to synthesize other perspectives - that's the orchestrator's job.
-Focus deeply on your assigned lens.
-"""
-
-        if self.context:
-            system_prompt += f"\n\nRelevant context:\n{self.context}"
-
         try:
             response, provider = await router.generate(
                 prompt=question,
-                system=system_prompt,
+                system=self._system_prompt,
                 max_tokens=1024,
                 temperature=1.0,
-                verbose=verbose
+                verbose=verbose,
+                use_cache=use_cache,
+                models=AGENT_MODELS
             )
             return response
 
@@ -109,18 +421,207 @@ Focus deeply on your assigned lens.
             return f"[Error from {self.name}: {str(e)}]"
 
 
+class ReviewCache:
+    """
+    Prior review responses per framing, keyed by reviewed-content embedding.
+
+    Persisted as JSONL so iterative review sessions across CLI runs can
+    update an earlier review instead of writing a new one from scratch.
+    Entries are keyed by framing name and text, so editing a lens (e.g. the
+    style guide embedded in Voice & Style) invalidates its prior reviews.
+    Only the newest max_per_framing reviews per lens are kept. lookup/add
+    do file I/O, so async callers run them in a worker thread; a lock keeps
+    concurrent lenses consistent.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        threshold: float = REVIEW_CACHE_THRESHOLD,
+        max_per_framing: int = REVIEW_CACHE_MAX_PER_FRAMING
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.max_per_framing = max_per_framing
+        self._entries: Optional[Dict[tuple, List[Dict[str, Any]]]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[tuple, List[Dict[str, Any]]]:
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        lines = 0
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        entry = json.loads(line)
+                        self._keep(entry)
+                    except (ValueError, KeyError):
+                        continue  # Skip torn/corrupt lines
+        except FileNotFoundError:
+            return self._entries
+
+        # Compact once the log holds mostly dropped (old, stale-lens or corrupt) entries
+        kept = sum(len(entries) for entries in self._entries.values())
+        if lines > 2 * kept:
+            self._rewrite()
+        return self._entries
+
+    def _keep(self, entry: Dict[str, Any]):
+        """Add entry to its framing's list, dropping the oldest beyond max_per_framing"""
+        entries = self._entries.setdefault((entry["framing"], entry["framing_text"]), [])
+        entries.append(entry)
+        if len(entries) > self.max_per_framing:
+            del entries[0]
+
+    def _rewrite(self):
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            for entries in self._entries.values():
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, framing_name: str, framing: str, content_vec) -> Optional[Dict[str, Any]]:
+        """Most similar prior review for this framing at or above threshold"""
+        with self._lock:
+            candidates = list(self._load().get((framing_name, framing), []))
+
+        best, best_score = None, self.threshold
+        for entry in candidates:
+            score = float(sum(a * b for a, b in zip(entry["embedding"], content_vec)))
+            if score >= best_score:
+                best, best_score = entry, score
+        return best
+
+    def add(self, framing_name: str, framing: str, content: str, content_vec, response: str):
+        entry = {
+            "framing": framing_name,
+            "framing_text": framing,
+            "content": content,
+            "embedding": [float(x) for x in content_vec],
+            "response": response,
+        }
+        with self._lock:
+            self._load()
+            self._keep(entry)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+
+
+class ReviewAgent(Agent):
+    """
+    Review lens that reuses its prior review of similar content.
+
+    On a cache hit the previous review plus a diff of the content is sent
+    to the local model to revise, instead of a full-cost provider call.
+    """
+
+    def __init__(self, name: str, framing: str, content: str, content_vec, cache: ReviewCache):
+        super().__init__(name, framing)
+        self.content = content
+        self.content_vec = content_vec
+        self.cache = cache
+
+    async def respond(
+        self,
+        question: str,
+        verbose: bool = False,
+        use_cache: Optional[bool] = None
+    ) -> str:
+        prior = await asyncio.to_thread(self.cache.lookup, self.name, self.framing, self.content_vec)
+        if prior is not None:
+            if prior["content"] == self.content:
+                return prior["response"]
+
+            local_up = (await router.probe_all()).get("local", False)
+            if local_up:
+                try:
+                    return await self._update_review(prior)
+                except Exception as e:
+                    if verbose:
+                        _log(f"⚠️  Local review update failed for {self.name}: {e}")
+
+        response = await super().respond(question, verbose=verbose, use_cache=use_cache)
+        if not response.startswith(f"[Error from {self.name}:"):
+            await asyncio.to_thread(
+                self.cache.add, self.name, self.framing, self.content, self.content_vec, response
+            )
+        return response
+
+    async def _update_review(self, prior: Dict[str, Any]) -> str:
+        diff = "".join(difflib.unified_diff(
+            prior["content"].splitlines(keepends=True),
+            self.content.splitlines(keepends=True),
+            fromfile="previous",
+            tofile="current",
+        ))
+        prompt = f"""Below is your review of an earlier version of a piece of writing, followed by a diff from that version to the current one.
+
+Update the review so it applies to the current version. Keep feedback that still applies, drop feedback the changes resolved, and add feedback on changed passages.
+
+PREVIOUS REVIEW:
+{prior["response"]}
+
+DIFF:
+{diff}
+"""
+        return await router.providers["local"].generate(
+            prompt=prompt,
+            system=self._system_prompt,
+            max_tokens=1024,
+            temperature=1.0
+        )
+
+
 class CommitteeOrchestrator:
     """Orchestrates multi-agent committees for consciousness computing"""
 
     def __init__(self):
         LOG_DIR.mkdir(parents=True, exist_ok=True)
+        self._sem = asyncio.Semaphore(MAX_PARALLEL) if MAX_PARALLEL > 0 else None
+        self._log_queue: asyncio.Queue = asyncio.Queue()
+        self._log_task: Optional[asyncio.Task] = None
+
+        # Review lenses embed the style guide head; built once, refreshed on mtime change
+        self._style_guide_mtime_ns = _style_guide_mtime_ns()
+        self._review_framings = _build_review_framings(_load_style_guide(self._style_guide_mtime_ns))
+
+        self._semantic_cache = SemanticCache(AIN_LOG) if SEMANTIC_CACHE_ENABLED else None
+        self._review_cache = ReviewCache(REVIEW_CACHE) if REVIEW_CACHE_ENABLED else None
+
+    async def aclose(self):
+        """Flush pending session logs and release provider connections"""
+        if self._log_task is not None:
+            await self._log_queue.join()
+            self._log_task.cancel()
+            try:
+                await self._log_task
+            except asyncio.CancelledError:
+                pass
+            self._log_task = None
+
+        await router.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
     async def deliberate(
         self,
         question: str,
         framings: List[Dict[str, str]],
         context: str = "",
-        verbose: bool = False
+        verbose: bool = False,
+        agents: Optional[List[Agent]] = None,
+        use_semantic_cache: bool = True,
+        on_responses: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
         Run a deliberation committee.
@@ -130,34 +631,64 @@ class CommitteeOrchestrator:
             framings: List of dicts with 'name' and 'framing' keys
             context: Optional shared context for all agents
             verbose: Print provider routing info
+            agents: Prebuilt agents matching framings (default: plain Agents)
+            use_semantic_cache: Allow reusing a similar prior deliberation
+                (when AIN_SEMANTIC_CACHE=1)
+            on_responses: Called with the agent responses before synthesis starts
+            on_text: Called with each synthesis text chunk as it streams
 
         Returns:
             Dict with responses, synthesis, and metadata
         """
 
+        if use_semantic_cache and self._semantic_cache is not None:
+            try:
+                hit = await asyncio.to_thread(self._semantic_cache.lookup, question, framings, context)
+            except ImportError as e:
+                _log(f"⚠️  Semantic cache disabled: {e}")
+                self._semantic_cache = None
+                hit = None
+            if hit is not None:
+                similarity, cached = hit
+                _log(f"\n♻️  Reusing prior deliberation (similarity {similarity:.2f})")
+                return {**cached, "cache": "semantic_hit", "cache_similarity": similarity}
+
         _log(f"\n🧠 Spawning committee with {len(framings)} agents...")
 
-        # Show available providers
+        # Show available providers (probe once up front; agents reuse the cached result)
+        await router.probe_all()
         available = router.get_available_providers()
         if verbose:
             _log(f"   Available providers: {', '.join([p[1].name for p in available])}")
         _log()
 
         # Create agents
-        agents = [
-            Agent(f["name"], f["framing"], context)
-            for f in framings
-        ]
+        if agents is None:
+            agents = [
+                Agent(f["name"], f["framing"], context)
+                for f in framings
+            ]
 
         # Parallel execution
         _log("⚡ Running parallel deliberation...")
-        start_time = datetime.now()
-
-        responses = await asyncio.gather(*[
-            agent.respond(question, verbose=False) for agent in agents  # Don't spam verbose per agent
-        ])
-
-        elapsed = (datetime.now() - start_time).total_seconds()
+        start_time = time.perf_counter()
+
+        async def _run(index: int, agent: Agent) -> tuple[int, str]:
+            if self._sem is None:
+                return index, await agent.respond(question, verbose=False)  # Don't spam verbose per agent
+            async with self._sem:
+                return index, await agent.respond(question, verbose=False)
+
+        # Collect as they finish, rendering each synthesis section while the
+        # slower agents are still running; framing order is restored below
+        responses: List[str] = [""] * len(agents)
+        sections: List[str] = [""] * len(agents)
+        for coro in asyncio.as_completed([_run(i, a) for i, a in enumerate(agents)]):
+            index, response = await coro
+            responses[index] = response
+            sections[index] = _render_response_section(agents[index].name, agents[index].framing, response)
+
+        elapsed = time.perf_counter() - start_time
         _log(f"✅ Collected {len(responses)} responses in {elapsed:.1f}s\n")
 
         # Build response dict
@@ -171,13 +702,17 @@ class CommitteeOrchestrator:
 
         # Synthesize
         _log("🔮 Generating dialectical synthesis...")
-        synthesis, synthesis_provider = await self._synthesize(question, agent_responses, verbose)
+        if on_responses:
+            on_responses(agent_responses)
+        responses_text = "".join({agents[i].name: sections[i] for i in range(len(agents))}.values())
+        synthesis, synthesis_provider = await self._synthesize(question, responses_text, verbose, on_text)
 
         # Log session
         session = {
             "timestamp": datetime.now().isoformat(),
             "question": question,
             "framings": framings,
+            "context": context,
             "responses": agent_responses,
             "synthesis": synthesis,
             "elapsed_seconds": elapsed,
@@ -185,78 +720,70 @@ class CommitteeOrchestrator:
         }
 
         self._log_session(session)
+        if self._semantic_cache is not None:
+            await asyncio.to_thread(self._semantic_cache.add, session)
 
         return session
 
     async def _synthesize(
         self,
         question: str,
-        responses: Dict[str, Dict],
-        verbose: bool = False
+        responses_text: str,
+        verbose: bool = False,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> tuple[str, str]:
-        """Generate dialectical synthesis from agent responses"""
-
-        # Build prompt with all responses
-        responses_text = ""
-        for name, data in responses.items():
-            responses_text += f"\n## {name} ({data['framing']})\n\n{data['response']}\n"
-
-        synthesis_prompt = f"""You are synthesizing a multi-perspective committee deliberation.
-
-ORIGINAL QUESTION:
-{question}
-
-AGENT RESPONSES:
-{responses_text}
-
-Your task: Generate a dialectical synthesis that:
-
-1. **Identifies Key Tensions**: Where do perspectives conflict or diverge?
-2. **Maps Polarities**: What are the thesis/antithesis pairs?
-3. **Synthesizes Higher-Order Insights**: What emerges from holding tensions together?
-4. **Detects Novelty**: Is this just recombination or genuine emergence?
-5. **Provides Recommendation**: What's the integrated path forward?
-
-Format your synthesis as:
-
-### Synthesis
-
-[2-3 paragraphs integrating the perspectives]
-
-### Key Tensions
-
-- **[Tension 1]**: [Description]
-- **[Tension 2]**: [Description]
-
-### Emergence Detected
-
-[Rating: ⭐ Recombination | ⭐⭐ Synthesis | ⭐⭐⭐ Breakthrough]
-
-[Explanation of why this rating]
-
-### Recommended Action
+        """Generate dialectical synthesis from rendered agent response sections"""
 
-[Clear next step that honors the dialectic]
-"""
+        synthesis_prompt = "".join((_SYNTH_PREFIX, question, _SYNTH_MID, responses_text, _SYNTH_SUFFIX))
 
         response, provider = await router.generate(
             prompt=synthesis_prompt,
             max_tokens=2048,
             temperature=1.0,
-            verbose=verbose
+            verbose=verbose,
+            on_text=on_text,
+            models=SYNTH_MODELS
         )
 
         return (response, provider)
 
     def _log_session(self, session: Dict[str, Any]):
-        """Append session to JSONL log"""
-        with open(AIN_LOG, 'a') as f:
-            f.write(json.dumps(session) + "\n")
+        """Queue session for the background JSONL writer"""
+        if self._log_task is None:
+            self._log_task = asyncio.create_task(self._log_worker())
+        self._log_queue.put_nowait(session)
+
+    async def _log_worker(self):
+        """Drain the log queue, appending batches to the JSONL log off the event loop"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._log_queue.get()]
+            while not self._log_queue.empty():
+                batch.append(self._log_queue.get_nowait())
+            try:
+                await loop.run_in_executor(None, self._append_sessions, batch)
+            except Exception as e:
+                _log(f"⚠️  Failed to write session log: {e}")
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+
+    @staticmethod
+    def _append_sessions(sessions: List[Dict[str, Any]]):
+        """Append sessions to JSONL log in a single write"""
+        if orjson is not None:
+            data = b"".join([orjson.dumps(session) + b"\n" for session in sessions])
+        else:
+            data = "".join([json.dumps(session) + "\n" for session in sessions]).encode()
+        with open(AIN_LOG, 'ab') as f:
+            f.write(data)
 
     async def review_writing(
         self,
         file_path: str,
-        verbose: bool = False
+        verbose: bool = False,
+        on_responses: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
         Multi-perspective writing review.
@@ -264,6 +791,7 @@ Format your synthesis as:
         Args:
             file_path: Path to markdown file to review
             verbose: Print provider routing info
+            on_responses, on_text: Streaming hooks, as for deliberate()
 
         Returns:
             Dict with reviews, synthesis, and metadata
@@ -272,61 +800,65 @@ Format your synthesis as:
         # Read file
         try:
             with open(file_path, 'r') as f:
-                content = f.read()
+                content = f.read(REVIEW_MAX_CHARS + 1)  # One extra char detects truncation
         except FileNotFoundError:
             _log(f"Error: File not found: {file_path}")
             return {}
 
-        # Read writing style guide if available
-        style_guide = ""
-        style_path = CONTEXT_DIR / "writing-style.md"
-        if style_path.exists():
-            with open(style_path, 'r') as f:
-                style_guide = f.read()
+        truncated = len(content) > REVIEW_MAX_CHARS
 
-        # Define review lenses
-        framings = [
-            {
-                "name": "Technical Accuracy",
-                "framing": "Review for technical accuracy, logical consistency, and factual correctness. Flag anything misleading or imprecise."
-            },
-            {
-                "name": "Voice & Style",
-                "framing": f"Review for voice consistency and style. Reference the style guide:\n\n{style_guide[:500]}...\n\nFlag AI-speak, corporate jargon, or places where the voice slips."
-            },
-            {
-                "name": "Audience Resonance",
-                "framing": "Review from the reader's perspective. What's confusing? What assumptions are made? What needs more context or examples?"
-            },
-            {
-                "name": "Structure & Flow",
-                "framing": "Review the structure and flow. Are transitions smooth? Is the argument building logically? Are sections in the right order?"
-            },
-            {
-                "name": "Depth & Impact",
-                "framing": "Review for intellectual depth and potential impact. What could be explored more deeply? What insights are underdeveloped? What's the archetypal/mythic dimension?"
-            }
-        ]
+        # Review lenses (rebuilt only when the style guide changes)
+        mtime_ns = _style_guide_mtime_ns()
+        if mtime_ns != self._style_guide_mtime_ns:
+            self._style_guide_mtime_ns = mtime_ns
+            self._review_framings = _build_review_framings(_load_style_guide(mtime_ns))
+        framings = self._review_framings
 
         question = f"""Review this piece of writing:
 
 ---
-{content[:3000]}{'...' if len(content) > 3000 else ''}
+{content[:REVIEW_MAX_CHARS]}{'...' if truncated else ''}
 ---
 
 Provide specific, actionable feedback from your lens.
 Quote specific passages when giving feedback.
 """
 
+        # Reuse prior reviews of similar content when enabled
+        agents = None
+        if self._review_cache is not None:
+            reviewed = content[:REVIEW_MAX_CHARS]
+            try:
+                content_vec = (await asyncio.to_thread(embedder.embed, [reviewed]))[0]
+                agents = [
+                    ReviewAgent(f["name"], f["framing"], reviewed, content_vec, self._review_cache)
+                    for f in framings
+                ]
+            except ImportError as e:
+                _log(f"⚠️  Review cache disabled: {e}")
+                self._review_cache = None
+
         # Run deliberation
-        return await self.deliberate(question, framings, verbose=verbose)
+        # No semantic reuse: a lightly edited file is "similar" to its last version,
+        # but needs a fresh review (ReviewAgent updates prior reviews from the diff)
+        return await self.deliberate(
+            question, framings, verbose=verbose, agents=agents, use_semantic_cache=False,
+            on_responses=on_responses, on_text=on_text
+        )
 
 
-async def main(args):
+async def main(args, output: Optional["_StreamingOutput"] = None):
     """CLI interface for AIN orchestrator"""
 
-    orchestrator = CommitteeOrchestrator()
+    async with CommitteeOrchestrator() as orchestrator:
+        return await _run_command(orchestrator, args, output)
+
+
+async def _run_command(orchestrator: CommitteeOrchestrator, args, output: Optional["_StreamingOutput"] = None):
+    """Dispatch a CLI command to the orchestrator (rendering live through output, if given)"""
+
     command = args.command
+    stream = {"on_responses": output.on_responses, "on_text": output.on_text} if output else {}
 
     if command == "deliberate":
         question = args.question
@@ -355,12 +887,12 @@ async def main(args):
             }
         ]
 
-        result = await orchestrator.deliberate(question, framings, verbose=args.verbose)
+        result = await orchestrator.deliberate(question, framings, verbose=args.verbose, **stream)
         return result
 
     elif command == "review-writing":
         file_path = args.file_path
-        result = await orchestrator.review_writing(file_path, verbose=args.verbose)
+        result = await orchestrator.review_writing(file_path, verbose=args.verbose, **stream)
         return result if result else {"error": "File not found"}
 
     elif command == "custom-deliberate":
@@ -368,8 +900,9 @@ async def main(args):
         config_path = args.config
 
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                raw = f.read()
+            config = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception as e:
             _log(f"Error loading config: {e}")
             return {"error": f"Config load failed: {str(e)}"}
@@ -377,55 +910,72 @@ async def main(args):
         framings = config.get("framings", [])
         context = config.get("context", "")
 
-        result = await orchestrator.deliberate(question, framings, context, verbose=args.verbose)
+        result = await orchestrator.deliberate(question, framings, context, verbose=args.verbose, **stream)
         return result
 
     else:
         return {"error": f"Unknown command: {command}"}
 
 
+def _print_human_header(responses: Dict[str, Any], command: str, question: str = "", file_path: str = ""):
+    """Print the header and agent responses, up to the SYNTHESIS heading"""
+    print("\n" + "="*80)
+    if command == "review-writing":
+        print(f"WRITING REVIEW: {file_path}")
+    else:
+        print(f"QUESTION: {question}")
+    print("="*80)
+
+    for name, data in responses.items():
+        print(f"\n### {name}")
+        if command != "review-writing" and "framing" in data:
+            print(f"*{data['framing']}*\n")
+        print(data['response'])
+        print()
+
+    print("\n" + "="*80)
+    print("SYNTHESIS")
+    print("="*80)
+
+
 def _print_human_readable(result: Dict[str, Any], command: str, question: str = "", file_path: str = ""):
     """Print results in human-readable format"""
     if "error" in result:
         print(f"Error: {result['error']}")
         return
 
-    if command == "deliberate" or command == "custom-deliberate":
-        print("\n" + "="*80)
-        print(f"QUESTION: {question}")
-        print("="*80)
-
-        for name, data in result["responses"].items():
-            print(f"\n### {name}")
-            if "framing" in data:
-                print(f"*{data['framing']}*\n")
-            print(data['response'])
-            print()
-
-        print("\n" + "="*80)
-        print("SYNTHESIS")
-        print("="*80)
+    if command in ("deliberate", "custom-deliberate", "review-writing"):
+        _print_human_header(result["responses"], command, question, file_path)
         print(result["synthesis"])
         print()
 
-    elif command == "review-writing":
-        print("\n" + "="*80)
-        print(f"WRITING REVIEW: {file_path}")
-        print("="*80)
 
-        for name, data in result["responses"].items():
-            print(f"\n### {name}")
-            print(data['response'])
-            print()
+class _StreamingOutput:
+    """
+    Human-readable CLI output that renders the synthesis as it streams.
 
-        print("\n" + "="*80)
-        print("SYNTHESIS")
-        print("="*80)
-        print(result["synthesis"])
-        print()
+    If nothing was streamed (semantic cache hit, error result), the caller
+    prints the finished result with _print_human_readable instead.
+    """
 
+    def __init__(self, command: str, question: str = "", file_path: str = ""):
+        self.command = command
+        self.question = question
+        self.file_path = file_path
+        self.started = False
 
-if __name__ == "__main__":
+    def on_responses(self, responses: Dict[str, Any]):
+        _print_human_header(responses, self.command, self.question, self.file_path)
+        sys.stdout.flush()
+        self.started = True
+
+    def on_text(self, text: str):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def _build_parser():
+    """Argument parser for the AIN CLI"""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -473,23 +1023,48 @@ For custom deliberations, create a JSON file with framings:
     custom_parser.add_argument("--json-pretty", action="store_true", help="Pretty-print JSON (implies --json)")
     custom_parser.add_argument("--verbose", action="store_true", help="Show provider routing info")
 
-    args = parser.parse_args()
+    return parser
+
+
+def cli(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the AIN CLI in-process.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
-        sys.exit(1)
+        return 1
 
     # Handle json-pretty (implies json)
     if hasattr(args, "json_pretty") and args.json_pretty:
         args.json = True
 
+    # Human-readable output streams the synthesis as it arrives
+    output = None
+    if not args.json:
+        output = _StreamingOutput(
+            args.command,
+            question=getattr(args, "question", ""),
+            file_path=getattr(args, "file_path", "")
+        )
+
     # Run main and handle output
     try:
-        result = asyncio.run(main(args))
+        result = asyncio.run(main(args, output))
 
         # Output results
         if args.json:
             _emit_json(_result_envelope_ok(result), pretty=args.json_pretty)
+        elif output.started:
+            print("\n")  # End the streamed synthesis
         else:
             _print_human_readable(
                 result,
@@ -498,16 +1073,23 @@ For custom deliberations, create a JSON file with framings:
                 file_path=getattr(args, "file_path", "")
             )
 
-        sys.exit(0)
+        return 0
 
     except Exception as e:
         _log(f"❌ AIN failed: {str(e)}")
 
         if hasattr(args, "json") and args.json:
-            _emit_json(_result_envelope_err(stage="main", err=e), pretty=getattr(args, "json_pretty", False))
+            _emit_json(
+                _result_envelope_err(stage="main", err=e, want_traceback=getattr(args, "verbose", False)),
+                pretty=getattr(args, "json_pretty", False)
+            )
         else:
             _log(f"\nError: {str(e)}")
             if hasattr(args, "verbose") and args.verbose:
                 _log(traceback.format_exc())
 
-        sys.exit(1)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
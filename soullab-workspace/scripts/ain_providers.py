@@ -5,10 +5,22 @@ Supports: Anthropic, OpenAI, local models (Ollama)
 Automatic failover when primary provider fails
 """
 
+import asyncio
+import functools
+import hashlib
+import importlib
+import json
 import os
+import re
+import socket
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable
 from pathlib import Path
+from urllib.parse import urlsplit
 
 # Try loading environment
 try:
@@ -24,6 +36,105 @@ try:
 except ImportError:
     pass
 
+# Optional fast JSON (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Only needed by the Ollama provider
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# How long provider availability probes stay fresh (seconds)
+PROBE_TTL_SECONDS = 60.0
+
+# Exact-match response cache (opt-in: AIN_CACHE=1)
+RESPONSE_CACHE_ENABLED = os.environ.get("AIN_CACHE") == "1"
+RESPONSE_CACHE_PATH = Path.home() / "soullab-workspace" / ".logs" / "ain_cache" / "responses.jsonl"
+RESPONSE_CACHE_MAX_ENTRIES = 1000
+RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Ollama liveness probe (TCP connect to the API port)
+OLLAMA_PROBE_TIMEOUT_SECONDS = 0.2
+
+# How long Ollama keeps the model loaded between requests
+OLLAMA_KEEP_ALIVE = os.environ.get("AIN_OLLAMA_KEEP_ALIVE", "30m")
+
+# Fallback classifiers for provider errors that don't arrive as typed SDK exceptions
+_ANTHROPIC_BILLING_RE = re.compile(r"credit balance|billing", re.IGNORECASE)
+_OPENAI_QUOTA_RE = re.compile(r"insufficient_quota", re.IGNORECASE)
+
+# Streamed through on_text when a provider fails after emitting partial text
+_FAILOVER_NOTICE = "\n\n[{name} failed mid-response ({error}); retrying with the next provider]\n\n"
+
+# Router provider names and their default failover order
+VALID_PROVIDERS = frozenset({"anthropic", "openai", "local"})
+DEFAULT_PRIORITY = ("anthropic", "openai", "local")
+
+# Default max in-flight requests per provider
+PROVIDER_MAX_CONCURRENCY = 32
+
+# Shared HTTP connection pool settings for provider clients
+HTTP_MAX_CONNECTIONS = 1000
+HTTP_MAX_KEEPALIVE = 200
+HTTP_KEEPALIVE_SECONDS = 60
+
+
+# host -> (checked_at, alive)
+_ollama_probe_cache: Dict[str, tuple[float, bool]] = {}
+
+
+def _ollama_alive(host: str) -> bool:
+    """TCP-connect to the Ollama API port, caching the answer for PROBE_TTL_SECONDS"""
+    now = time.monotonic()
+    cached = _ollama_probe_cache.get(host)
+    if cached is not None and now - cached[0] < PROBE_TTL_SECONDS:
+        return cached[1]
+
+    parts = urlsplit(host)
+    try:
+        with socket.create_connection(
+            (parts.hostname or "localhost", parts.port or 11434),
+            timeout=OLLAMA_PROBE_TIMEOUT_SECONDS
+        ):
+            alive = True
+    except OSError:
+        alive = False
+
+    _ollama_probe_cache[host] = (now, alive)
+    return alive
+
+
+def _make_http_client(client_cls):
+    """
+    Pooled keep-alive client for an SDK provider (HTTP/2 when h2 is installed).
+
+    client_cls is the SDK's DefaultAsyncHttpxClient, so limits are built from
+    whichever httpx flavor that SDK version expects. The timeout is left to
+    the SDK default (10 min read, 5 s connect) so an unreachable provider
+    fails over quickly.
+    """
+    httpx_base = next(c for c in client_cls.__mro__ if c.__module__.startswith("httpx"))
+    httpx = importlib.import_module(httpx_base.__module__.split(".")[0])
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return client_cls(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_SECONDS,
+        ),
+    )
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
@@ -34,9 +145,17 @@ class LLMProvider(ABC):
         prompt: str,
         system: str = "",
         max_tokens: int = 1024,
-        temperature: float = 1.0
+        temperature: float = 1.0,
+        on_text: Optional[Callable[[str], None]] = None,
+        model: Optional[str] = None
     ) -> str:
-        """Generate text from prompt"""
+        """
+        Generate text from prompt.
+
+        Responses are streamed; on_text (if given) receives each text chunk
+        as it arrives. model overrides the provider's default model for this
+        call.
+        """
         pass
 
     @abstractmethod
@@ -50,13 +169,21 @@ class LLMProvider(ABC):
         """Provider name"""
         pass
 
+    async def aclose(self):
+        """Release pooled connections (no-op by default)"""
+        pass
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude provider"""
 
+    DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        # Pooled SDK client, owned by this instance and bound to the loop it was created on
         self._client = None
+        self._client_loop = None
 
     def is_available(self) -> bool:
         return bool(self.api_key)
@@ -65,52 +192,88 @@ class AnthropicProvider(LLMProvider):
     def name(self) -> str:
         return "Anthropic Claude"
 
+    def _get_client(self):
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            try:
+                from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+            except ImportError:
+                raise ImportError("anthropic package not installed. Run: pip install anthropic")
+            # A client from an earlier (now closed) loop can't be reused or closed; drop it
+            self._client = AsyncAnthropic(api_key=self.api_key, http_client=_make_http_client(DefaultAsyncHttpxClient))
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self):
+        client, loop = self._client, self._client_loop
+        self._client = self._client_loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
+
     async def generate(
         self,
         prompt: str,
         system: str = "",
         max_tokens: int = 1024,
-        temperature: float = 1.0
+        temperature: float = 1.0,
+        on_text: Optional[Callable[[str], None]] = None,
+        model: Optional[str] = None
     ) -> str:
-        if not self._client:
-            try:
-                from anthropic import AsyncAnthropic
-                self._client = AsyncAnthropic(api_key=self.api_key)
-            except ImportError:
-                raise ImportError("anthropic package not installed. Run: pip install anthropic")
+        client = self._get_client()
 
         try:
-            message = await self._client.messages.create(
-                model="claude-sonnet-4-5-20250929",
+            parts = []
+            async with client.messages.stream(
+                model=model or self.DEFAULT_MODEL,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 system=system if system else None,
                 messages=[{"role": "user", "content": prompt}]
-            )
-            return message.content[0].text
+            ) as stream:
+                async for text in stream.text_stream:
+                    parts.append(text)
+                    if on_text:
+                        on_text(text)
+            return "".join(parts)
 
         except Exception as e:
-            error_str = str(e)
+            raise self._classify_error(e) from e
 
-            # Check for billing/credit errors
-            if "credit balance" in error_str.lower() or "billing" in error_str.lower():
-                raise ProviderUnavailableError(
-                    f"Anthropic: Credit balance too low. Add credits at https://console.anthropic.com/settings/billing"
-                )
-            # Check for auth errors
-            elif "401" in error_str or "authentication" in error_str.lower():
-                raise ProviderUnavailableError(f"Anthropic: Invalid API key")
-            # Other errors
-            else:
-                raise ProviderUnavailableError(f"Anthropic: {error_str}")
+    @staticmethod
+    def _classify_error(e: Exception) -> "ProviderUnavailableError":
+        import anthropic  # Already imported by _get_client
+
+        # Credit exhaustion arrives as a 400 with no dedicated type
+        if isinstance(e, anthropic.APIStatusError) and _ANTHROPIC_BILLING_RE.search(e.message):
+            return ProviderUnavailableError(
+                "Anthropic: Credit balance too low. Add credits at https://console.anthropic.com/settings/billing"
+            )
+        if isinstance(e, anthropic.AuthenticationError):
+            return ProviderUnavailableError("Anthropic: Invalid API key")
+        if isinstance(e, anthropic.RateLimitError):
+            return ProviderUnavailableError("Anthropic: Rate limited")
+        if isinstance(e, anthropic.APIError):
+            return ProviderUnavailableError(f"Anthropic: {e}")
+
+        # Untyped exceptions (transport wrappers, etc.)
+        error_str = str(e)
+        if _ANTHROPIC_BILLING_RE.search(error_str):
+            return ProviderUnavailableError(
+                "Anthropic: Credit balance too low. Add credits at https://console.anthropic.com/settings/billing"
+            )
+        return ProviderUnavailableError(f"Anthropic: {error_str}")
 
 
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT provider"""
 
+    DEFAULT_MODEL = "gpt-4-turbo-preview"
+
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        # Pooled SDK client, owned by this instance and bound to the loop it was created on
         self._client = None
+        self._client_loop = None
 
     def is_available(self) -> bool:
         return bool(self.api_key)
@@ -119,19 +282,34 @@ class OpenAIProvider(LLMProvider):
     def name(self) -> str:
         return "OpenAI GPT-4"
 
+    def _get_client(self):
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            try:
+                from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+            except ImportError:
+                raise ImportError("openai package not installed. Run: pip install openai")
+            # A client from an earlier (now closed) loop can't be reused or closed; drop it
+            self._client = AsyncOpenAI(api_key=self.api_key, http_client=_make_http_client(DefaultAsyncHttpxClient))
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self):
+        client, loop = self._client, self._client_loop
+        self._client = self._client_loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
+
     async def generate(
         self,
         prompt: str,
         system: str = "",
         max_tokens: int = 1024,
-        temperature: float = 1.0
+        temperature: float = 1.0,
+        on_text: Optional[Callable[[str], None]] = None,
+        model: Optional[str] = None
     ) -> str:
-        if not self._client:
-            try:
-                from openai import AsyncOpenAI
-                self._client = AsyncOpenAI(api_key=self.api_key)
-            except ImportError:
-                raise ImportError("openai package not installed. Run: pip install openai")
+        client = self._get_client()
 
         try:
             messages = []
@@ -139,24 +317,46 @@ class OpenAIProvider(LLMProvider):
                 messages.append({"role": "system", "content": system})
             messages.append({"role": "user", "content": prompt})
 
-            response = await self._client.chat.completions.create(
-                model="gpt-4-turbo-preview",
+            stream = await client.chat.completions.create(
+                model=model or self.DEFAULT_MODEL,
                 messages=messages,
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                stream=True
             )
-            return response.choices[0].message.content
+            parts = []
+            async for chunk in stream:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    parts.append(text)
+                    if on_text:
+                        on_text(text)
+            return "".join(parts)
 
         except Exception as e:
-            error_str = str(e)
-            if "insufficient_quota" in error_str.lower():
-                raise ProviderUnavailableError(
-                    f"OpenAI: Insufficient quota. Add credits at https://platform.openai.com/account/billing"
-                )
-            elif "invalid_api_key" in error_str.lower():
-                raise ProviderUnavailableError(f"OpenAI: Invalid API key")
-            else:
-                raise ProviderUnavailableError(f"OpenAI: {error_str}")
+            raise self._classify_error(e) from e
+
+    @staticmethod
+    def _classify_error(e: Exception) -> "ProviderUnavailableError":
+        import openai  # Already imported by _get_client
+
+        # Quota exhaustion is a 429 distinguished only by its error code
+        if isinstance(e, openai.RateLimitError) and getattr(e, "code", None) == "insufficient_quota":
+            return ProviderUnavailableError(
+                "OpenAI: Insufficient quota. Add credits at https://platform.openai.com/account/billing"
+            )
+        if isinstance(e, openai.AuthenticationError):
+            return ProviderUnavailableError("OpenAI: Invalid API key")
+        if isinstance(e, openai.OpenAIError):
+            return ProviderUnavailableError(f"OpenAI: {e}")
+
+        # Untyped exceptions (transport wrappers, etc.)
+        error_str = str(e)
+        if _OPENAI_QUOTA_RE.search(error_str):
+            return ProviderUnavailableError(
+                "OpenAI: Insufficient quota. Add credits at https://platform.openai.com/account/billing"
+            )
+        return ProviderUnavailableError(f"OpenAI: {error_str}")
 
 
 class OllamaProvider(LLMProvider):
@@ -165,47 +365,79 @@ class OllamaProvider(LLMProvider):
     def __init__(self, model: str = "deepseek-r1:latest", host: str = "http://localhost:11434"):
         self.model = model
         self.host = host
-        self._client = None
+        self._session = None
+        self._session_loop = None
 
     def is_available(self) -> bool:
-        # TODO: Check if Ollama is running
-        return True
+        return _ollama_alive(self.host)
 
     @property
     def name(self) -> str:
         return f"Ollama ({self.model})"
 
+    def _get_session(self):
+        # Created lazily: aiohttp sessions must be made inside a running loop, and
+        # one from an earlier (now closed) loop can't be reused
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session_loop = loop
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_MAX_KEEPALIVE,
+                    keepalive_timeout=HTTP_KEEPALIVE_SECONDS
+                )
+            )
+        return self._session
+
+    async def aclose(self):
+        session, loop = self._session, self._session_loop
+        self._session = self._session_loop = None
+        if session is not None and not session.closed and loop is asyncio.get_running_loop():
+            await session.close()
+
     async def generate(
         self,
         prompt: str,
         system: str = "",
         max_tokens: int = 1024,
-        temperature: float = 1.0
+        temperature: float = 1.0,
+        on_text: Optional[Callable[[str], None]] = None,
+        model: Optional[str] = None
     ) -> str:
-        try:
-            import aiohttp
-        except ImportError:
+        if aiohttp is None:
             raise ImportError("aiohttp package not installed. Run: pip install aiohttp")
 
         try:
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    "model": self.model,
-                    "prompt": f"{system}\n\n{prompt}" if system else prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": temperature,
-                        "num_predict": max_tokens
-                    }
+            session = self._get_session()
+            payload = {
+                "model": model or self.model,
+                "prompt": f"{system}\n\n{prompt}" if system else prompt,
+                "stream": True,
+                "keep_alive": OLLAMA_KEEP_ALIVE,
+                "options": {
+                    "temperature": temperature,
+                    "num_predict": max_tokens
                 }
-
-                async with session.post(f"{self.host}/api/generate", json=payload) as resp:
-                    if resp.status != 200:
-                        raise ProviderUnavailableError(f"Ollama: HTTP {resp.status}")
-
-                    data = await resp.json()
-                    return data.get("response", "")
+            }
+
+            async with session.post(f"{self.host}/api/generate", json=payload) as resp:
+                if resp.status != 200:
+                    raise ProviderUnavailableError(f"Ollama: HTTP {resp.status}")
+
+                # Newline-delimited JSON objects, one per token batch
+                parts = []
+                async for line in resp.content:
+                    if not line.strip():
+                        continue
+                    data = orjson.loads(line) if orjson is not None else json.loads(line)
+                    text = data.get("response", "")
+                    if text:
+                        parts.append(text)
+                        if on_text:
+                            on_text(text)
+                    if data.get("done"):
+                        break
+                return "".join(parts)
 
         except Exception as e:
             raise ProviderUnavailableError(f"Ollama: {str(e)}")
@@ -216,6 +448,108 @@ class ProviderUnavailableError(Exception):
     pass
 
 
+class ResponseCache:
+    """
+    Exact-match LLM response cache.
+
+    In-memory LRU backed by an append-only JSONL file so hits survive
+    across CLI runs. Entries older than ttl_seconds are treated as misses.
+    get/set do file I/O, so async callers run them in a worker thread;
+    a lock keeps concurrent callers consistent.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: Optional[OrderedDict] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**fields: Any) -> str:
+        """Stable SHA-256 key over the request fields"""
+        return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+    def _put(self, key: str, entry: tuple):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self) -> OrderedDict:
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = OrderedDict()
+        lines = 0
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        record = json.loads(line)
+                        self._put(record["key"], (record["text"], record["provider"], record["ts"]))
+                    except (ValueError, KeyError):
+                        continue  # Skip torn/corrupt lines
+        except FileNotFoundError:
+            return self._entries
+
+        # Compact once the log holds mostly evicted/overwritten entries
+        if lines > 2 * self.max_entries:
+            self._rewrite()
+        return self._entries
+
+    def _rewrite(self):
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            for key, (text, provider, ts) in self._entries.items():
+                f.write(json.dumps({"key": key, "text": text, "provider": provider, "ts": ts}) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[tuple[str, str]]:
+        """Return (response_text, provider_name) or None on miss/expiry"""
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None:
+                return None
+
+            text, provider, ts = entry
+            if time.time() - ts > self.ttl_seconds:
+                del entries[key]
+                return None
+
+            entries.move_to_end(key)
+            return (text, provider)
+
+    def set(self, key: str, text: str, provider: str):
+        with self._lock:
+            self._load()
+            ts = time.time()
+            self._put(key, (text, provider, ts))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps({"key": key, "text": text, "provider": provider, "ts": ts}) + "\n")
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_PATH)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_chain(chain: str) -> tuple[str, ...]:
+    """Parse and validate a comma-separated fallback chain (e.g. "openai,local,anthropic")"""
+    priority = tuple(sys.intern(p.strip()) for p in chain.split(","))
+    invalid = [p for p in priority if p not in VALID_PROVIDERS]
+    if invalid:
+        raise ValueError(f"Invalid providers in fallback chain: {invalid}. Valid: {sorted(VALID_PROVIDERS)}")
+    return priority
+
+
 class AINProviderRouter:
     """Routes AIN requests across multiple providers with failover"""
 
@@ -230,6 +564,11 @@ class AINProviderRouter:
         """
         self.preference = preference or os.environ.get("AIN_PROVIDER", "auto")
 
+        # Configurable priority order via env var or parameter
+        # (validated first, so a bad chain fails before any provider is built)
+        fallback_chain = fallback_chain or os.environ.get("AIN_FALLBACK_CHAIN", "")
+        self.priority: tuple[str, ...] = _parse_chain(fallback_chain) if fallback_chain else DEFAULT_PRIORITY
+
         # Initialize all providers
         self.providers = {
             "anthropic": AnthropicProvider(),
@@ -237,20 +576,51 @@ class AINProviderRouter:
             "local": OllamaProvider(),
         }
 
-        # Configurable priority order via env var or parameter
-        fallback_chain = fallback_chain or os.environ.get("AIN_FALLBACK_CHAIN", "")
-        if fallback_chain:
-            # Parse comma-separated chain (e.g., "openai,local,anthropic")
-            custom_priority = [p.strip() for p in fallback_chain.split(",")]
-            # Validate all providers exist
-            valid_providers = set(self.providers.keys())
-            invalid = [p for p in custom_priority if p not in valid_providers]
-            if invalid:
-                raise ValueError(f"Invalid providers in fallback chain: {invalid}. Valid: {list(valid_providers)}")
-            self.priority = custom_priority
-        else:
-            # Default priority order
-            self.priority = ["anthropic", "openai", "local"]
+        # Per-provider in-flight limits (AIN_<NAME>_MAX_CONC) keep big committees
+        # under the connection pool size and provider rate limits
+        self._max_conc = {
+            name: int(os.environ.get(f"AIN_{name.upper()}_MAX_CONC", PROVIDER_MAX_CONCURRENCY))
+            for name in self.providers
+        }
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+        self._sems_loop = None
+
+        # Cached availability from probe_all()
+        self._probe: Optional[Dict[str, bool]] = None
+        self._probe_ts = 0.0
+
+    def _get_sems(self) -> Dict[str, asyncio.Semaphore]:
+        """Per-provider semaphores for the running loop (a cached router may outlive a loop)"""
+        loop = asyncio.get_running_loop()
+        if self._sems_loop is not loop:
+            self._sems = {name: asyncio.Semaphore(n) for name, n in self._max_conc.items()}
+            self._sems_loop = loop
+        return self._sems
+
+    async def aclose(self):
+        """Close every provider's pooled connections"""
+        await asyncio.gather(*[p.aclose() for p in self.providers.values()])
+
+    def _probe_fresh(self) -> bool:
+        return self._probe is not None and time.monotonic() - self._probe_ts < PROBE_TTL_SECONDS
+
+    async def probe_all(self, force: bool = False) -> Dict[str, bool]:
+        """
+        Probe every provider's availability concurrently.
+
+        Results are cached for PROBE_TTL_SECONDS so routing within a
+        deliberation doesn't re-probe.
+        """
+        if not force and self._probe_fresh():
+            return self._probe
+
+        results = await asyncio.gather(
+            *[asyncio.to_thread(p.is_available) for p in self.providers.values()],
+            return_exceptions=True
+        )
+        self._probe = {name: result is True for name, result in zip(self.providers, results)}
+        self._probe_ts = time.monotonic()
+        return self._probe
 
     def get_available_providers(self) -> list:
         """Get list of available providers in priority order"""
@@ -262,10 +632,11 @@ class AINProviderRouter:
         else:
             order = self.priority
 
+        probe = self._probe if self._probe_fresh() else None
         return [
             (name, self.providers[name])
             for name in order
-            if self.providers[name].is_available()
+            if (probe[name] if probe is not None else self.providers[name].is_available())
         ]
 
     async def generate(
@@ -274,14 +645,48 @@ class AINProviderRouter:
         system: str = "",
         max_tokens: int = 1024,
         temperature: float = 1.0,
-        verbose: bool = False
+        verbose: bool = False,
+        use_cache: Optional[bool] = None,
+        on_text: Optional[Callable[[str], None]] = None,
+        models: Optional[Dict[str, str]] = None
     ) -> tuple[str, str]:
         """
         Generate text with automatic failover.
 
+        Args:
+            use_cache: Serve/store exact-match responses (defaults to AIN_CACHE=1)
+            on_text: Called with each streamed text chunk (a cache hit arrives as
+                one chunk). If a provider fails after emitting partial text, a
+                failover notice is emitted before the next provider's text.
+            models: Model per provider name (e.g. {"anthropic": "claude-haiku-..."});
+                providers not listed use their default model
+
         Returns:
             (response_text, provider_name)
         """
+        if use_cache is None:
+            use_cache = RESPONSE_CACHE_ENABLED
+
+        cache_key = None
+        if use_cache:
+            cache_key = ResponseCache.make_key(
+                preference=self.preference,
+                priority=self.priority,
+                system=system,
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                models=models,
+            )
+            cached = await asyncio.to_thread(response_cache.get, cache_key)
+            if cached is not None:
+                if verbose:
+                    print(f"✅ Cache hit ({cached[1]})")
+                if on_text:
+                    on_text(cached[0])  # Streaming callers still get the text, in one chunk
+                return cached
+
+        await self.probe_all()
         available = self.get_available_providers()
 
         if not available:
@@ -293,38 +698,57 @@ class AINProviderRouter:
         last_error = None
 
         for provider_name, provider in available:
+            streamed = []  # Chunks this attempt passed to on_text
+
+            def attempt_on_text(text: str, streamed=streamed):
+                streamed.append(text)
+                on_text(text)
+
             try:
                 if verbose:
                     print(f"Trying {provider.name}...")
 
-                response = await provider.generate(
-                    prompt=prompt,
-                    system=system,
-                    max_tokens=max_tokens,
-                    temperature=temperature
-                )
+                async with self._get_sems()[provider_name]:
+                    response = await provider.generate(
+                        prompt=prompt,
+                        system=system,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        on_text=attempt_on_text if on_text else None,
+                        model=models.get(provider_name) if models else None
+                    )
 
                 if verbose:
                     print(f"✅ Used {provider.name}")
 
+                if cache_key:
+                    await asyncio.to_thread(response_cache.set, cache_key, response, provider_name)
+
                 return (response, provider_name)
 
             except ProviderUnavailableError as e:
                 last_error = e
                 if verbose:
                     print(f"⚠️  {provider.name} unavailable: {e}")
-                continue
 
             except Exception as e:
                 last_error = e
                 if verbose:
                     print(f"❌ {provider.name} error: {e}")
-                continue
+
+            if streamed:
+                on_text(_FAILOVER_NOTICE.format(name=provider.name, error=last_error))
 
         # All providers failed
         raise RuntimeError(f"All providers failed. Last error: {last_error}")
 
 
+@functools.lru_cache(maxsize=16)
+def _get_router(preference: Optional[str], fallback_chain: Optional[str]) -> AINProviderRouter:
+    """Shared router per (preference, fallback_chain) so providers and their pools are reused"""
+    return AINProviderRouter(preference=preference, fallback_chain=fallback_chain)
+
+
 # Convenience function
 async def get_llm_response(
     prompt: str,
@@ -350,7 +774,7 @@ async def get_llm_response(
     Returns:
         (response_text, provider_used)
     """
-    router = AINProviderRouter(preference=provider, fallback_chain=fallback_chain)
+    router = _get_router(provider, fallback_chain)
     return await router.generate(
         prompt=prompt,
         system=system,
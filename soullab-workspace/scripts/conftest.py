@@ -0,0 +1,11 @@
+"""
+Shared test setup for scripts/: make the AIN modules importable.
+
+Run directly (python3 test_*.py), the scripts directory is already sys.path[0];
+this covers runners that don't add it (e.g. pytest --import-mode=importlib).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
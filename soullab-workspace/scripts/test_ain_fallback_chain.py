@@ -5,75 +5,76 @@ Test configurable fallback chain for AIN provider router.
 Verifies that AIN_FALLBACK_CHAIN env var correctly sets provider priority.
 """
 
+import functools
 import os
 import sys
-from pathlib import Path
-
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent))
 
 from ain_providers import AINProviderRouter
 
 
-def test_default_priority():
-    """Test that default priority is anthropic -> openai -> local"""
-    router = AINProviderRouter()
-
-    assert router.priority == ["anthropic", "openai", "local"], \
-        f"Expected default priority ['anthropic', 'openai', 'local'], got {router.priority}"
-
-    print("✅ Default priority: anthropic -> openai -> local")
+@functools.lru_cache(maxsize=None)
+def router_for(chain, env_chain):
+    """Shared router per (fallback_chain, AIN_FALLBACK_CHAIN) so each config is built once"""
+    return AINProviderRouter(fallback_chain=chain)
 
 
-def test_custom_priority_via_parameter():
-    """Test custom priority via parameter"""
-    router = AINProviderRouter(fallback_chain="openai,local,anthropic")
+def priority_for(chain=None):
+    """Priority (an immutable tuple) of the shared router for chain"""
+    return router_for(chain, os.environ.get("AIN_FALLBACK_CHAIN")).priority
 
-    assert router.priority == ["openai", "local", "anthropic"], \
-        f"Expected priority ['openai', 'local', 'anthropic'], got {router.priority}"
 
-    print("✅ Custom priority (parameter): openai -> local -> anthropic")
+# (description, fallback_chain, AIN_FALLBACK_CHAIN, expected priority, expected error)
+CASES = [
+    ("Default priority: anthropic -> openai -> local",
+     None, None, ("anthropic", "openai", "local"), None),
+    ("Custom priority (parameter): openai -> local -> anthropic",
+     "openai,local,anthropic", None, ("openai", "local", "anthropic"), None),
+    ("Custom priority (env var): local -> openai",
+     None, "local,openai", ("local", "openai"), None),
+    ("Local-first (sovereignty) priority: local -> anthropic -> openai",
+     "local,anthropic,openai", None, ("local", "anthropic", "openai"), None),
+    ("Invalid provider correctly raises ValueError",
+     "invalid,openai", None, None, ValueError),
+]
 
 
-def test_custom_priority_via_env():
-    """Test custom priority via AIN_FALLBACK_CHAIN env var"""
-    # Set env var
-    os.environ["AIN_FALLBACK_CHAIN"] = "local,openai"
+def check_case(description, chain, env_chain, expected, error):
+    """Build a router for one case and check its priority (or the expected error)"""
+    if env_chain is not None:
+        os.environ["AIN_FALLBACK_CHAIN"] = env_chain
 
     try:
-        router = AINProviderRouter()
-
-        assert router.priority == ["local", "openai"], \
-            f"Expected priority ['local', 'openai'], got {router.priority}"
-
-        print("✅ Custom priority (env var): local -> openai")
+        if error is not None:
+            try:
+                priority_for(chain)
+            except error as e:
+                if "invalid" not in str(e).lower():
+                    raise AssertionError(f"Unexpected error message: {e}")
+            else:
+                raise AssertionError(f"Should have raised {error.__name__} for chain {chain!r}")
+        else:
+            priority = priority_for(chain)
+            assert priority == expected, \
+                f"Expected priority {expected}, got {priority}"
     finally:
-        # Clean up
-        del os.environ["AIN_FALLBACK_CHAIN"]
+        if env_chain is not None:
+            del os.environ["AIN_FALLBACK_CHAIN"]
 
+    print(f"✅ {description}")
 
-def test_local_first_chain():
-    """Test local-first sovereignty chain"""
-    router = AINProviderRouter(fallback_chain="local,anthropic,openai")
 
-    assert router.priority == ["local", "anthropic", "openai"], \
-        f"Expected priority ['local', 'anthropic', 'openai'], got {router.priority}"
+def test_fallback_chains():
+    """Test every fallback chain configuration in CASES, reporting all failures"""
+    failures = []
+    for case in CASES:
+        try:
+            check_case(*case)
+        except Exception as e:
+            print(f"❌ {case[0]}: {e}")
+            failures.append(case[0])
 
-    print("✅ Local-first (sovereignty) priority: local -> anthropic -> openai")
-
-
-def test_invalid_provider():
-    """Test that invalid providers raise ValueError"""
-    try:
-        router = AINProviderRouter(fallback_chain="invalid,openai")
-        print("❌ FAIL: Should have raised ValueError for invalid provider")
-        sys.exit(1)
-    except ValueError as e:
-        if "invalid" in str(e).lower():
-            print("✅ Invalid provider correctly raises ValueError")
-        else:
-            print(f"❌ FAIL: Unexpected error message: {e}")
-            sys.exit(1)
+    if failures:
+        raise AssertionError(f"{len(failures)} of {len(CASES)} cases failed: {'; '.join(failures)}")
 
 
 def main():
@@ -83,11 +84,7 @@ def main():
     print()
 
     try:
-        test_default_priority()
-        test_custom_priority_via_parameter()
-        test_custom_priority_via_env()
-        test_local_first_chain()
-        test_invalid_provider()
+        test_fallback_chains()
 
         print()
         print("=" * 60)
@@ -3,55 +3,183 @@
 Zero-cost regression test for AIN JSON output.
 
 Tests that AIN correctly outputs valid JSON even when all providers fail.
+The CLI runs once in-process and the envelope tests share that run; one
+subprocess run (overlapping the in-process tests) covers the script end to end.
 """
 
+import compileall
+import contextlib
+import functools
+import io
 import os
 import json
+import re
 import subprocess
 import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Optional fast JSON parsing (falls back to stdlib json)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+import ain_orchestrator
+from ain_providers import AINProviderRouter
+
+# Bytecode cache for the script subprocess, kept outside the checkout and reused across runs.
+# Per-user: a world-writable location like /tmp would let another user plant bytecode we execute
+PYCACHE_PREFIX = Path.home() / ".cache" / "ain" / "pycache"
+
+# Invalid keys force provider failure (Anthropic first, which fails with the invalid key)
+FAILURE_ENV = {
+    "ANTHROPIC_API_KEY": "invalid-key-for-testing",
+    "OPENAI_API_KEY": "invalid-key-for-testing",
+    "AIN_PROVIDER": "anthropic",
+}
+
+# Orchestrator status-log lines ("Spawning committee...", "Running parallel...")
+STATUS_RE = re.compile(r"Spawning|Running")
+
+# AIN JSON envelope contract: success carries the deliberation, failure the error
+AIN_ENVELOPE_SCHEMA = {
+    "oneOf": [
+        {
+            "type": "object",
+            "properties": {
+                "ok": {"const": True},
+                "responses": {"type": "object"},
+                "synthesis": {"type": "string"},
+            },
+            "required": ["ok", "responses", "synthesis"],
+        },
+        {
+            "type": "object",
+            "properties": {
+                "ok": {"const": False},
+                "stage": {"type": "string"},
+                "error": {"type": "string"},
+                "error_type": {"type": "string"},
+            },
+            "required": ["ok", "error"],
+        },
+    ]
+}
+
+# Optional: validate with jsonschema when installed (built once, reused by every test)
+try:
+    from jsonschema import Draft202012Validator, ValidationError
+    ENVELOPE_VALIDATOR = Draft202012Validator(AIN_ENVELOPE_SCHEMA)
+except ImportError:
+    ENVELOPE_VALIDATOR = None
+
+
+def validate_envelope(data):
+    """Raise AssertionError unless data matches AIN_ENVELOPE_SCHEMA"""
+    if ENVELOPE_VALIDATOR is not None:
+        try:
+            ENVELOPE_VALIDATOR.validate(data)
+        except ValidationError as e:
+            raise AssertionError(f"JSON envelope invalid: {e.message}")
+        return
+
+    # Fallback without jsonschema: required fields of the matching branch
+    if not isinstance(data, dict) or "ok" not in data:
+        raise AssertionError("JSON must include 'ok' field")
+    branch = AIN_ENVELOPE_SCHEMA["oneOf"][0 if data["ok"] else 1]
+    missing = [field for field in branch["required"] if field not in data]
+    if missing:
+        raise AssertionError(f"JSON envelope (ok={data['ok']}) missing fields: {missing}")
 
 
-def test_json_output_on_failure():
-    """Test that JSON output is valid even when AIN fails (no API keys)"""
+def prewarm_bytecode():
+    """Compile the scripts into PYCACHE_PREFIX so the subprocess skips parsing source"""
+    saved_prefix = sys.pycache_prefix
+    sys.pycache_prefix = str(PYCACHE_PREFIX)
+    try:
+        compileall.compile_dir(Path(__file__).parent, maxlevels=0, quiet=1)
+    finally:
+        sys.pycache_prefix = saved_prefix
 
-    print("=" * 60)
-    print("AIN JSON Output Regression Test")
-    print("=" * 60)
-    print("\nTesting that stdout is valid JSON even on failure...")
+
+@functools.lru_cache(maxsize=None)
+def failure_envelope():
+    """Run the AIN CLI once in-process under FAILURE_ENV; returns (stdout, stderr, returncode)"""
+    argv = ["deliberate", "JSON output smoke test", "--json"]
+
+    print(f"Running (in-process): ain_orchestrator {' '.join(argv)}")
+    print(f"Environment: Invalid API keys (forcing provider failure)")
     print()
 
-    # Create environment without API keys (force failure)
-    env = dict(os.environ)
-    # Remove all possible API keys
-    env.pop("ANTHROPIC_API_KEY", None)
-    env.pop("OPENAI_API_KEY", None)
-    # Set invalid keys to force failure
-    env["ANTHROPIC_API_KEY"] = "invalid-key-for-testing"
-    env["OPENAI_API_KEY"] = "invalid-key-for-testing"
-    env["AIN_PROVIDER"] = "anthropic"  # Force Anthropic which will fail with invalid key
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with mock.patch.dict(os.environ, FAILURE_ENV):  # Restores the touched keys on exit
+        # The module-level router was built from the import-time env; rebuild it for this run
+        with mock.patch.object(ain_orchestrator, "router", AINProviderRouter()):
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                returncode = ain_orchestrator.cli(argv)
+    return stdout.getvalue(), stderr.getvalue(), returncode
+
+
+@functools.lru_cache(maxsize=None)
+def script_run():
+    """Launch the end-to-end script run once; main() starts it first so it overlaps the in-process tests"""
+    prewarm_bytecode()
+
+    # -S skips site initialization (.pth files, sitecustomize); handing over this
+    # interpreter's resolved sys.path keeps the same packages importable
+    env = {
+        **os.environ,
+        **FAILURE_ENV,
+        "PYTHONPYCACHEPREFIX": str(PYCACHE_PREFIX),
+        "PYTHONPATH": os.pathsep.join(p for p in sys.path if p),
+    }
 
     cmd = [
         sys.executable,
+        "-S",
         "scripts/ain_orchestrator.py",
         "deliberate",
         "JSON output smoke test",
         "--json",
     ]
 
-    print(f"Running: {' '.join(cmd)}")
-    print(f"Environment: No API keys (forcing provider failure)")
+    # Capture to temp files (bounded memory, bytes straight into the JSON parser)
+    stdout = tempfile.TemporaryFile()
+    stderr = tempfile.TemporaryFile()
+    p = subprocess.Popen(cmd, stdout=stdout, stderr=stderr, env=env, cwd=os.path.expanduser("~/soullab-workspace"))
+    return p, stdout, stderr
+
+
+def stop_script_run():
+    """Kill the script run if it is still going and release its capture files"""
+    p, stdout, stderr = script_run()
+    if p.poll() is None:
+        p.kill()
+        p.wait()
+    stdout.close()
+    stderr.close()
+
+
+def test_json_output_on_failure():
+    """Test that JSON output is valid even when AIN fails (invalid API keys)"""
+
+    print("=" * 60)
+    print("AIN JSON Output Regression Test")
+    print("=" * 60)
+    print("\nTesting that stdout is valid JSON even on failure...")
     print()
 
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env, cwd=os.path.expanduser("~/soullab-workspace"))
-    stdout = (p.stdout or "").strip()
-    stderr = (p.stderr or "").strip()
+    stdout, stderr, returncode = failure_envelope()
 
-    print("Return code:", p.returncode)
+    print("Return code:", returncode)
     print()
 
     # Verify stdout is valid JSON
     try:
-        data = json.loads(stdout)
+        data = json_loads(stdout)
         print("✅ stdout is valid JSON")
     except Exception as e:
         print("❌ FAIL: stdout is not valid JSON")
@@ -60,33 +188,29 @@ def test_json_output_on_failure():
         raise RuntimeError(f"JSON parsing failed: {e}")
 
     # Verify JSON structure
-    print(f"✅ JSON contains 'ok' field: {data.get('ok')}")
-
-    if "ok" not in data:
-        raise AssertionError("JSON must include 'ok' field")
+    validate_envelope(data)
+    print(f"✅ JSON matches envelope schema (ok={data['ok']})")
 
     if data["ok"] is False:
-        # Error path - verify error fields present
-        if "error" not in data:
-            raise AssertionError("JSON must include 'error' field on failure")
         print(f"✅ Error path: JSON contains error: {data.get('error')[:50]}...")
         print(f"✅ Error path: JSON contains error_type: {data.get('error_type')}")
     else:
-        # Success path - verify result fields present
-        if "responses" not in data or "synthesis" not in data:
-            raise AssertionError("JSON must include 'responses' and 'synthesis' on success")
         print(f"✅ Success path: JSON contains responses: {len(data.get('responses', {}))} agents")
         print(f"✅ Success path: JSON contains synthesis: {len(data.get('synthesis', ''))} chars")
         print(f"✅ Success path: Used provider: {data.get('provider_used')}")
 
+    if (returncode == 0) != data["ok"]:
+        raise AssertionError(f"Exit code {returncode} disagrees with ok={data['ok']}")
+    print(f"✅ Exit code {returncode} matches ok={data['ok']}")
+
     # Verify stderr contains logs (not data)
-    if "Spawning committee" in stderr or "Running parallel" in stderr:
+    if STATUS_RE.search(stderr):
         print("✅ Status logs correctly routed to stderr")
     else:
         print("⚠️  Warning: Expected status logs in stderr")
 
     # Verify stdout contains ONLY JSON (no status logs)
-    if "Spawning" in stdout or "Running" in stdout:
+    if STATUS_RE.search(stdout):
         raise AssertionError("Status logs leaked into stdout (should be stderr only)")
 
     print("✅ Status logs not present in stdout")
@@ -104,54 +228,73 @@ def test_json_output_on_failure():
 
 
 def test_json_pretty_output():
-    """Test that --json-pretty outputs readable JSON"""
+    """Test that the --json-pretty formatter outputs readable JSON"""
 
     print()
     print("=" * 60)
-    print("Testing --json-pretty mode")
+    print("Testing --json-pretty formatting")
     print("=" * 60)
     print()
 
-    # Use minimal environment (no keys, forcing failure)
-    env = dict(os.environ)
-    env.pop("ANTHROPIC_API_KEY", None)
-    env.pop("OPENAI_API_KEY", None)
-
-    cmd = [
-        sys.executable,
-        "scripts/ain_orchestrator.py",
-        "deliberate",
-        "Pretty JSON test",
-        "--json-pretty",
-    ]
-
-    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env, cwd=os.path.expanduser("~/soullab-workspace"))
-    stdout = (p.stdout or "").strip()
+    # Re-format the envelope from the shared in-process run (no second deliberation)
+    data = json_loads(failure_envelope()[0])
+    output = ain_orchestrator.format_envelope(data, pretty=True)
 
     # Verify it's valid JSON
-    data = json.loads(stdout)
+    if json_loads(output) != data:
+        raise AssertionError("Pretty JSON does not round-trip to the same envelope")
     print("✅ --json-pretty produces valid JSON")
 
     # Verify it's actually pretty (has newlines and indentation)
-    if "\n" not in stdout:
+    if "\n" not in output:
         raise AssertionError("Expected pretty JSON to have newlines")
 
-    if "  " not in stdout:  # Two spaces = indentation
+    if "  " not in output:  # Two spaces = indentation
         raise AssertionError("Expected pretty JSON to have indentation")
 
     print("✅ JSON is formatted with newlines and indentation")
+    print(f"✅ --json-pretty has same structure (ok={data['ok']})")
 
-    # Verify same structure as --json (must have 'ok' field)
-    if "ok" not in data:
-        raise AssertionError("--json-pretty must have 'ok' field")
 
-    print(f"✅ --json-pretty has same structure (ok={data['ok']})")
+def test_json_output_subprocess():
+    """End-to-end: the script itself emits clean JSON on stdout"""
+
+    print()
+    print("=" * 60)
+    print("Testing script end to end (subprocess)")
+    print("=" * 60)
+    print()
+
+    p, stdout_file, stderr_file = script_run()
+    p.wait()
+    stdout_file.seek(0)
+    stdout = stdout_file.read()
+
+    try:
+        data = json_loads(stdout)
+    except ValueError as e:
+        stderr_file.seek(0)
+        print("\nSTDOUT:", stdout[:500])
+        print("\nSTDERR:", stderr_file.read(500))
+        raise RuntimeError(f"JSON parsing failed: {e}")
+    print("✅ Script stdout is valid JSON")
+
+    validate_envelope(data)
+
+    if STATUS_RE.search(stdout.decode(errors="replace")):
+        raise AssertionError("Status logs leaked into stdout (should be stderr only)")
+
+    if (p.returncode == 0) != data["ok"]:
+        raise AssertionError(f"Exit code {p.returncode} disagrees with ok={data['ok']}")
+    print(f"✅ Script exit code {p.returncode} matches ok={data['ok']}")
 
 
 def main():
+    script_run()
     try:
         test_json_output_on_failure()
         test_json_pretty_output()
+        test_json_output_subprocess()
 
         print()
         print("=" * 60)
@@ -174,6 +317,8 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        stop_script_run()
 
 
 if __name__ == "__main__":
@@ -8,15 +8,11 @@ automatically fails over to OpenAI and completes successfully.
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent))
 
 from ain_orchestrator import CommitteeOrchestrator
 
 
-async def test_provider_failover():
+async def check_provider_failover(orchestrator):
     """Test that AIN automatically fails over from Anthropic to OpenAI"""
 
     print("=" * 60)
@@ -24,8 +20,6 @@ async def test_provider_failover():
     print("=" * 60)
     print()
 
-    orchestrator = CommitteeOrchestrator()
-
     # Simple question for quick test
     question = "What is consciousness computing in one sentence?"
 
@@ -101,8 +95,26 @@ async def test_provider_failover():
         return False
 
 
-async def main():
-    success = await test_provider_failover()
+# Async checks share one event loop and one orchestrator (and its connection pools).
+# Named check_* rather than test_* so pytest doesn't collect them: they take the
+# shared orchestrator and make live provider calls.
+ASYNC_TESTS = [check_provider_failover]
+
+
+async def run_async_tests():
+    async with CommitteeOrchestrator() as orchestrator:
+        return [await test(orchestrator) for test in ASYNC_TESTS]
+
+
+def main():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        results = loop.run_until_complete(run_async_tests())
+    finally:
+        loop.close()
+
+    success = all(results)
 
     print()
     print("=" * 60)
@@ -121,4 +133,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
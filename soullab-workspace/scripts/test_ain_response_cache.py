@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test the exact-match response cache used by the AIN provider router.
+
+Verifies LRU eviction, TTL expiry and compaction of the JSONL log.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ain_providers import ResponseCache
+
+
+def write_records(path, records):
+    """Write (key, text, ts) records as a response cache log"""
+    with open(path, 'w') as f:
+        for key, text, ts in records:
+            f.write(json.dumps({"key": key, "text": text, "provider": "anthropic", "ts": ts}) + "\n")
+
+
+def test_lru_eviction():
+    """Least recently used entry is evicted first; a get counts as a use"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(Path(tmp) / "lru.jsonl", max_entries=2)
+        cache.set("a", "A", "anthropic")
+        cache.set("b", "B", "openai")
+        assert cache.get("a") == ("A", "anthropic"), "Expected a hit for 'a'"
+
+        cache.set("c", "C", "local")
+        assert cache.get("b") is None, "Expected 'b' (least recently used) to be evicted"
+        assert cache.get("a") == ("A", "anthropic"), "Expected 'a' to survive eviction"
+        assert cache.get("c") == ("C", "local"), "Expected a hit for 'c'"
+
+    print("✅ LRU eviction drops the least recently used entry")
+
+
+def test_ttl_expiry():
+    """Entries older than ttl_seconds are misses, including ones loaded from disk"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ttl.jsonl"
+        now = time.time()
+        write_records(path, [("old", "stale", now - 120), ("new", "fresh", now)])
+
+        cache = ResponseCache(path, ttl_seconds=60)
+        assert cache.get("old") is None, "Expected the expired entry to miss"
+        assert cache.get("new") == ("fresh", "anthropic"), "Expected the fresh entry to hit"
+
+    print("✅ Expired entries are treated as misses")
+
+
+def test_rewrite_compaction():
+    """A log with more than 2 * max_entries lines is compacted to the live entries on load"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "compact.jsonl"
+        now = time.time()
+        write_records(path, [(f"k{i}", f"v{i}", now) for i in range(5)] + [("k4", "v4b", now)])
+
+        cache = ResponseCache(path, max_entries=2)
+        assert cache.get("k4") == ("v4b", "anthropic"), "Expected the latest write for 'k4' to win"
+        assert cache.get("k0") is None, "Expected 'k0' to be evicted on load"
+
+        with open(path) as f:
+            keys = [json.loads(line)["key"] for line in f]
+        assert keys == ["k3", "k4"], f"Expected the log compacted to ['k3', 'k4'], got {keys}"
+
+    print("✅ Oversized log is rewritten to the live entries")
+
+
+def main():
+    print("=" * 60)
+    print("AIN Response Cache Tests")
+    print("=" * 60)
+    print()
+
+    try:
+        test_lru_eviction()
+        test_ttl_expiry()
+        test_rewrite_compaction()
+
+        print()
+        print("=" * 60)
+        print("All tests PASSED ✅")
+        print("=" * 60)
+        sys.exit(0)
+
+    except AssertionError as e:
+        print()
+        print("=" * 60)
+        print(f"Test FAILED ❌: {e}")
+        print("=" * 60)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()